@@ -1,16 +1,25 @@
 import os
-import time
 import re
 import json
 import threading
+import queue
+import hashlib
+from collections import Counter, OrderedDict
+from itertools import islice
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 from pathlib import Path
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
@@ -30,12 +39,66 @@ IMAGES_DIR.mkdir(exist_ok=True)
 
 ELPAIS_OPINION = 'https://elpais.com/opinion/'
 
+# Number of local browsers used to scrape article pages in parallel
+LOCAL_POOL_SIZE = 4
+
+# URLs per scrape pass on a BrowserStack session; a session works through all its batches
+BROWSERSTACK_BATCH_SIZE = 5
+
+# Max seconds to wait for the element we need before parsing whatever has loaded
+PAGE_WAIT_TIMEOUT = 10
+
+# Patterns used on every article / title, compiled once
+_BODY_CLASS_RE = re.compile(r'article_body|articulo|cuerpo')
+_PUNCT_RE = re.compile(r"[^\w\s]")
+# Used with fullmatch(): '$' would also accept a trailing newline
+_OPINION_URL_RE = re.compile(r'https?://(?:[^/]*\.)?elpais\.com/(?:[^?#]*/)?opinion/.+\.html')
+
+# XPath queries run on every page, compiled once. The EXSLT re:test extension lets
+# the class match reuse _BODY_CLASS_RE.
+_XPATH_NS = {'re': 'http://exslt.org/regular-expressions'}
+_HEADLINE_HREFS = etree.XPath('//h2//a/@href | //h3//a/@href')
+_ARTICLE_BODY = etree.XPath('//*[@itemprop="articleBody"]')
+_BODY_BY_CLASS = etree.XPath(f'//*[re:test(@class, "{_BODY_CLASS_RE.pattern}")]', namespaces=_XPATH_NS)
+_OG_IMAGE = etree.XPath('string(//meta[@property="og:image"]/@content)')
+_VISIBLE_TEXT = etree.XPath('.//text()[not(parent::script or parent::style)]')
+
+# Extensions cover images are saved under
+IMAGE_EXTENSIONS = ('.jpg', '.png', '.gif', '.webp')
+
+HTTP_USER_AGENT = 'Mozilla/5.0 (compatible; elpais-opinion-scraper)'
+
+# Shared by all scraping threads; cover images download while the next pages load
+image_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='images')
+
+# One requests.Session per thread so image downloads reuse pooled keep-alive connections
+_thread_local = threading.local()
+
+
+def get_http_session():
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update({'User-Agent': HTTP_USER_AGENT})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _thread_local.session = session
+    return session
+
 
 def ensure_spanish_chrome_options():
     opts = ChromeOptions()
     # Force UI and Accept-Language to Spanish
     opts.add_argument('--lang=es')
-    opts.add_experimental_option('prefs', {'intl.accept_languages': 'es,es_ES'})
+    opts.add_experimental_option('prefs', {
+        'intl.accept_languages': 'es,es_ES',
+        # Cover images are fetched separately with requests, so the browser needn't load them
+        'profile.managed_default_content_settings.images': 2,
+    })
+    # We only read the DOM, so don't wait for images, ads and tracking beacons to finish loading
+    opts.page_load_strategy = 'eager'
     # headful by default so you can see it; uncomment for headless
     # opts.add_argument('--headless=new')
     return opts
@@ -49,6 +112,8 @@ def get_local_driver(browser='chrome'):
     elif browser == 'firefox':
         opts = FirefoxOptions()
         opts.set_preference('intl.accept_languages', 'es-ES, es')
+        opts.set_preference('permissions.default.image', 2)
+        opts.page_load_strategy = 'eager'
         driver = webdriver.Firefox(options=opts)
         return driver
     else:
@@ -57,22 +122,34 @@ def get_local_driver(browser='chrome'):
 
 # ---------- Scraping logic ----------
 
-def scrape_opinion_articles(driver, max_articles=5):
-    """Given an open webdriver on the Opinion landing, return a list of dicts with
-    title (spanish), url, body (spanish), cover_image_path (if downloaded), translated_title (placeholder).
+def _wait_for(driver, locator, timeout=PAGE_WAIT_TIMEOUT):
+    """Block until an element matching locator is present; on timeout, carry on with what has loaded."""
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+    except TimeoutException:
+        print(f"[Thread: {threading.current_thread().name}] Timed out waiting for {locator[1]} on {driver.current_url}")
+
+
+def _text(el):
+    """All text inside el with each piece stripped, like BeautifulSoup's get_text(strip=True).
+    As with bs4 4.10+, text inside <script> and <style> is skipped.
     """
+    return ''.join(t.strip() for t in _VISIBLE_TEXT(el))
+
+
+def collect_opinion_urls(driver, max_articles=5):
+    """Open the Opinion landing page and return up to max_articles article URLs."""
     print(f"[Thread: {threading.current_thread().name}] Opening {ELPAIS_OPINION}...")
     driver.get(ELPAIS_OPINION)
-    # Let page load and handle any cookie banners if necessary
-    time.sleep(2) 
+    # Wait until headlines are in the DOM instead of sleeping a fixed amount
+    _wait_for(driver, (By.CSS_SELECTOR, 'h2 a, h3 a'))
 
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
+    doc = lxml.html.fromstring(driver.page_source)
 
     # Find article links
     candidates = []
     # Look for links inside <h2> or <h3> tags, a common pattern for headlines
-    for a in soup.select('h2 a[href], h3 a[href]'):
-        href = a.get('href')
+    for href in _HEADLINE_HREFS(doc):
         if not href:
             continue
 
@@ -81,17 +158,11 @@ def scrape_opinion_articles(driver, max_articles=5):
             full = urljoin('https://elpais.com', href)
         
         # Filter for opinion articles (must be on elpais.com, contain /opinion/, and look like an article page)
-        if 'elpais.com' in full and '/opinion/' in full and full.endswith('.html'):
+        if _OPINION_URL_RE.fullmatch(full):
             candidates.append(full)
 
     # dedupe while preserving order
-    seen = set()
-    ordered = []
-    for u in candidates:
-        if u not in seen:
-            seen.add(u)
-            ordered.append(u)
-            
+    ordered = list(dict.fromkeys(candidates))
     article_urls = ordered[:max_articles]
 
     if not article_urls:
@@ -99,152 +170,346 @@ def scrape_opinion_articles(driver, max_articles=5):
     else:
         print(f"[Thread: {threading.current_thread().name}] Found {len(article_urls)} article URLs to scrape.")
 
+    return article_urls
 
-    results = []
-    for url in article_urls:
-        try:
-            print(f"[Thread: {threading.current_thread().name}] Scraping {url}...")
-            driver.get(url)
-            time.sleep(1.5)
-            page = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # Title
-            title_tag = page.find(['h1'])
-            title = title_tag.get_text(strip=True) if title_tag else 'No title found'
-            
-            # Body: many articles have <div class="article_body"> or <div itemprop="articleBody">
-            body = ''
-            body_container = page.find(attrs={'itemprop': 'articleBody'}) or page.find(class_=re.compile('article_body|articulo|cuerpo'))
-            if body_container:
-                paras = [p.get_text(strip=True) for p in body_container.find_all('p')]
-                body = '\n\n'.join([p for p in paras if p])
-            else:
-                # fallback: collect all <p> inside main
-                main_tag = page.find('main')
-                if main_tag:
-                    paras = [p.get_text(strip=True) for p in main_tag.find_all('p')]
-                    body = '\n\n'.join(paras[:40]) # Limit fallback
-                else:
-                    body = "No article body container found."
-
-
-            # Cover image: common patterns: figure img, meta property="og:image"
-            cover_path = None
-            img_url = None
-            
-            # Best method: OpenGraph meta tag
-            og = page.find('meta', property='og:image')
-            if og and og.get('content'):
-                img_url = og.get('content')
+
+def _scrape_one(driver, url):
+    """Scrape a single article page with the given driver. Returns None on failure."""
+    try:
+        print(f"[Thread: {threading.current_thread().name}] Scraping {url}...")
+        driver.get(url)
+        _wait_for(driver, (By.TAG_NAME, 'h1'))
+        doc = lxml.html.fromstring(driver.page_source)
+
+        # Title
+        title_tag = doc.find('.//h1')
+        title = _text(title_tag) if title_tag is not None else 'No title found'
+        # Start translating now so the API round trip overlaps with the remaining page loads
+        title_en_future = translation_pool.submit(translate_texts_google, [title]) if HAS_GOOGLE else None
+
+        # Body: many articles have <div class="article_body"> or <div itemprop="articleBody">
+        body = ''
+        containers = _ARTICLE_BODY(doc) or _BODY_BY_CLASS(doc)
+        if containers:
+            paras = (_text(p) for p in containers[0].iterdescendants('p'))
+            body = '\n\n'.join(p for p in paras if p)
+        else:
+            # fallback: collect all <p> inside main
+            main_tag = doc.find('.//main')
+            if main_tag is not None:
+                # Limit fallback; islice stops walking the tree once it has 40 matches
+                body = '\n\n'.join(_text(p) for p in islice(main_tag.iterdescendants('p'), 40))
             else:
-                # Fallback: Try to find the first <figure> and get an <img> from it
-                fig_tag = page.find('figure') 
-                if fig_tag:
-                    img_tag = fig_tag.find('img')
-                    if img_tag:
-                        # Check src, or data-src for lazy loading
-                        img_url = img_tag.get('src') or img_tag.get('data-src')
-
-            if img_url:
-                try:
-                    # Ensure URL is absolute
-                    if img_url.startswith('//'):
-                        img_url = 'https:' + img_url
-                    elif img_url.startswith('/'):
-                        img_url = urljoin('https://elpais.com', img_url)
-
-                    r = requests.get(img_url, timeout=15)
-                    if r.status_code == 200:
-                        # Clean the filename: get last part of URL, remove .html, keep first 50 chars
-                        url_slug = url.split('/')[-1].replace('.html', '')[:50]
-                        
-                        # Try to guess extension, default to .jpg
-                        content_type = r.headers.get('content-type')
-                        ext = '.jpg' # default
-                        if content_type:
-                            if 'jpeg' in content_type: ext = '.jpg'
-                            elif 'png' in content_type: ext = '.png'
-                            elif 'gif' in content_type: ext = '.gif'
-                            elif 'webp' in content_type: ext = '.webp'
-
-                        fname = IMAGES_DIR / (url_slug + ext)
-                        with open(fname, 'wb') as f:
-                            f.write(r.content)
-                        cover_path = str(fname)
-                except Exception as e:
-                    print('Image download failed for', img_url, e)
+                body = "No article body container found."
+
+
+        # Cover image: common patterns: figure img, meta property="og:image"
+        # Best method: OpenGraph meta tag
+        img_url = _OG_IMAGE(doc)
+        if not img_url:
+            # Fallback: Try to find the first <figure> and get an <img> from it
+            fig_tag = doc.find('.//figure')
+            if fig_tag is not None:
+                img_tag = fig_tag.find('.//img')
+                if img_tag is not None:
+                    # Check src, or data-src for lazy loading
+                    img_url = img_tag.get('src') or img_tag.get('data-src')
+
+        # Download in the background so the driver can move on to the next page
+        cover_future = image_pool.submit(_fetch_cover_image, url, img_url) if img_url else None
+
+        return {'url': url, 'title_es': title, 'body_es': body, 'cover_image': None, 'title_en': None,
+                'cover_image_future': cover_future, 'title_en_future': title_en_future}
+    except Exception as e:
+        print(f'Failed to scrape {url}: {e}')
+        return None
 
-            results.append({'url': url, 'title_es': title, 'body_es': body, 'cover_image': cover_path, 'title_en': None})
-        except Exception as e:
-            print(f'Failed to scrape {url}: {e}')
+
+def _fetch_cover_image(article_url, img_url):
+    """Download an article's cover image unless it is already on disk. Returns the local path or None."""
+    try:
+        # Ensure URL is absolute
+        if img_url.startswith('//'):
+            img_url = 'https:' + img_url
+        elif img_url.startswith('/'):
+            img_url = urljoin('https://elpais.com', img_url)
+
+        fname = _image_path(article_url, img_url)
+        # Already fetched by this or a parallel run (possibly saved under its Content-Type extension)
+        for ext in IMAGE_EXTENSIONS:
+            cached = fname.with_suffix(ext)
+            if cached.exists():
+                return str(cached)
+        return _download_image(img_url, fname)
+    except Exception as e:
+        print('Image download failed for', img_url, e)
+        return None
+
+
+def _resolve_cover_images(results):
+    """Wait for background image downloads and fill in r['cover_image']."""
+    for r in results:
+        fut = r.pop('cover_image_future', None)
+        r['cover_image'] = fut.result() if fut else None
     return results
 
 
+def _image_path(article_url, img_url):
+    """Deterministic local path for an article's cover image, known before any network I/O."""
+    # Clean the filename: get last part of URL, remove .html, keep first 50 chars
+    url_slug = article_url.split('/')[-1].replace('.html', '')[:50]
+    img_hash = hashlib.sha1(img_url.encode('utf-8')).hexdigest()[:12]
+
+    # Take the extension from the image URL, default to .jpg; _download_image corrects it from Content-Type
+    ext = os.path.splitext(urlparse(img_url).path)[1].lower()
+    if ext not in IMAGE_EXTENSIONS:
+        ext = '.jpg'
+    return IMAGES_DIR / f'{url_slug}-{img_hash}{ext}'
+
+
+def _content_type_extension(content_type):
+    """File extension for an image Content-Type, or None if it isn't one we recognise."""
+    if content_type:
+        if 'jpeg' in content_type: return '.jpg'
+        elif 'png' in content_type: return '.png'
+        elif 'gif' in content_type: return '.gif'
+        elif 'webp' in content_type: return '.webp'
+    return None
+
+
+def _download_image(img_url, fname):
+    """Stream img_url to fname in 64 KB chunks. Returns the saved path, or None on a non-200 response.
+    The extension of fname is replaced if the response's Content-Type says otherwise.
+    """
+    with get_http_session().get(img_url, stream=True, timeout=15) as r:
+        if r.status_code != 200:
+            return None
+        ext = _content_type_extension(r.headers.get('content-type'))
+        if ext and ext != fname.suffix:
+            fname = fname.with_suffix(ext)
+        # Write to a temp file first so an interrupted download never looks like a cached image
+        tmp = fname.with_name(f'{fname.name}.{threading.get_ident()}.part')
+        try:
+            with open(tmp, 'wb') as f:
+                for chunk in r.iter_content(65536):
+                    f.write(chunk)
+            os.replace(tmp, fname)
+        finally:
+            tmp.unlink(missing_ok=True)
+    return str(fname)
+
+
+def scrape_opinion_articles(driver, max_articles=5, article_urls=None):
+    """Given an open webdriver on the Opinion landing, return a list of dicts with
+    title (spanish), url, body (spanish), cover_image_path (if downloaded), translated_title (english).
+    If article_urls is given, the landing page is skipped and only those URLs are scraped.
+    """
+    if article_urls is None:
+        article_urls = collect_opinion_urls(driver, max_articles)
+    return scrape_urls(driver, article_urls)
+
+
+def scrape_urls(driver, urls):
+    """Scrape each URL in turn on an already open driver; failed articles are dropped."""
+    results = []
+    for url in urls:
+        res = _scrape_one(driver, url)
+        if res:
+            results.append(res)
+    return _resolve_title_translations(_resolve_cover_images(results))
+
+
+def scrape_urls_with_driver_pool(article_urls, driver_pool, max_workers):
+    """Scrape article_urls concurrently, borrowing drivers from driver_pool (a queue.Queue).
+    Results keep the order of article_urls; failed articles are dropped.
+    """
+    def task(url):
+        driver = driver_pool.get()
+        try:
+            return _scrape_one(driver, url)
+        finally:
+            driver_pool.put(driver)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        results = [res for res in ex.map(task, article_urls) if res]
+    return _resolve_title_translations(_resolve_cover_images(results))
+
+
 # ---------- Translation ----------
 
+# Cloud Translation v3 rejects requests much above 30K code points
+TRANSLATE_BATCH_SIZE = 100
+TRANSLATE_BATCH_CHARS = 25000
+
+# LRU of (sha1(text), target) -> translation, shared by all worker threads
+TRANSLATION_CACHE_SIZE = 2048
+_translation_cache = OrderedDict()
+_translation_cache_lock = threading.Lock()
+
+# One TranslationServiceClient for the whole process, built lazily by _get_translate_client
+_translate_client = None
+_translate_parent = None
+_translate_client_lock = threading.Lock()
+
+# Shared by all scraping threads; titles are translated while the next pages load
+translation_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='translate')
+
+
 def translate_texts_google(texts, target='en'):
     if not HAS_GOOGLE:
         raise RuntimeError('google-cloud-translate library not available. Install google-cloud-translate or implement alternate API.')
-    
-    client = translate.TranslationServiceClient()
-    project_id = os.environ.get('GOOGLE_CLOUD_PROJECT') or os.environ.get('GCP_PROJECT')
 
-    if not project_id:
-        # Try to load from credentials file if env var is not set
-        cred_path = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
-        if cred_path:
-            try:
-                with open(cred_path, 'r') as f:
-                    creds = json.load(f)
-                project_id = creds.get('project_id')
-            except Exception as e:
-                print(f"Could not read project_id from {cred_path}: {e}")
+    texts = list(texts)
+    keys = [_translation_key(text, target) for text in texts]
+    responses = [None] * len(texts)
+    with _translation_cache_lock:
+        for i, key in enumerate(keys):
+            if key in _translation_cache:
+                _translation_cache.move_to_end(key)
+                responses[i] = _translation_cache[key]
+    # Distinct uncached keys -> every index that needs that translation
+    uncached = {}
+    for i, key in enumerate(keys):
+        if responses[i] is None:
+            uncached.setdefault(key, []).append(i)
+    if not uncached:
+        return responses
+
+    client, parent = _get_translate_client()
+    translated = []
 
-    if not project_id:
-        raise RuntimeError(
-            'Could not determine Google Cloud Project ID. '
-            'Set GOOGLE_CLOUD_PROJECT env var or ensure "project_id" is in your GOOGLE_APPLICATION_CREDENTIALS JSON.'
-        )
-        
-    parent = f'projects/{project_id}/locations/global'
-    responses = []
-    
-    for text in texts:
+    # Send titles in batches (one round trip per batch) while staying under the request size limit
+    for batch in _chunk_texts([texts[idxs[0]] for idxs in uncached.values()]):
         response = client.translate_text(request={
             'parent': parent,
-            'contents': [text],
+            'contents': batch,
             'mime_type': 'text/plain',
             'target_language_code': target,
             'source_language_code': 'es' # Be explicit
         })
-        # response.translations is a list
-        translations = [t.translated_text for t in response.translations]
-        responses.append(translations[0] if translations else '')
+        # response.translations is a list, in the same order as contents
+        translated.extend(t.translated_text for t in response.translations)
+
+    if len(translated) != len(uncached):
+        raise RuntimeError(f'Expected {len(uncached)} translations from the API, got {len(translated)}')
+
+    with _translation_cache_lock:
+        for (key, idxs), text_en in zip(uncached.items(), translated):
+            for i in idxs:
+                responses[i] = text_en
+            _translation_cache[key] = text_en
+            _translation_cache.move_to_end(key)
+        while len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+            _translation_cache.popitem(last=False)
     return responses
 
 
+def _resolve_title_translations(results):
+    """Wait for the translations started while scraping and fill in r['title_en']."""
+    for r in results:
+        fut = r.pop('title_en_future', None)
+        if fut is None:
+            r['title_en'] = '(google lib missing)'
+            continue
+        try:
+            r['title_en'] = fut.result()[0]
+        except Exception as e:
+            print('Google Translate failed:', e)
+            r['title_en'] = '(translation failed)'
+    return results
+
+
+def _get_translate_client():
+    """Return the shared (client, parent), creating them on first use."""
+    global _translate_client, _translate_parent
+    with _translate_client_lock:
+        if _translate_client is not None:
+            return _translate_client, _translate_parent
+
+        project_id = os.environ.get('GOOGLE_CLOUD_PROJECT') or os.environ.get('GCP_PROJECT')
+
+        if not project_id:
+            # Try to load from credentials file if env var is not set
+            cred_path = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
+            if cred_path:
+                try:
+                    with open(cred_path, 'r') as f:
+                        creds = json.load(f)
+                    project_id = creds.get('project_id')
+                except Exception as e:
+                    print(f"Could not read project_id from {cred_path}: {e}")
+
+        if not project_id:
+            raise RuntimeError(
+                'Could not determine Google Cloud Project ID. '
+                'Set GOOGLE_CLOUD_PROJECT env var or ensure "project_id" is in your GOOGLE_APPLICATION_CREDENTIALS JSON.'
+            )
+
+        _translate_client = translate.TranslationServiceClient()
+        _translate_parent = f'projects/{project_id}/locations/global'
+        return _translate_client, _translate_parent
+
+
+def _translation_key(text, target):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest(), target
+
+
+def _chunk_texts(texts, max_items=TRANSLATE_BATCH_SIZE, max_chars=TRANSLATE_BATCH_CHARS):
+    batch = []
+    size = 0
+    for text in texts:
+        if batch and (len(batch) >= max_items or size + len(text) > max_chars):
+            yield batch
+            batch = []
+            size = 0
+        batch.append(text)
+        size += len(text)
+    if batch:
+        yield batch
+
+
 # ---------- Analysis ----------
 
+# Above this many titles, counting is vectorized with pandas (if installed)
+PANDAS_MIN_TITLES = 100
+
+
 def analyze_translated_headers(translated_titles):
+    translated_titles = list(translated_titles)
+    if len(translated_titles) > PANDAS_MIN_TITLES:
+        try:
+            return _analyze_translated_headers_pandas(translated_titles)
+        except ImportError:
+            pass # pandas is optional; fall back to the pure-Python count
+
     # split into words, normalize: lower, strip punctuation
     words = []
     for t in translated_titles:
         if not t: continue
         # remove punctuation and split
-        cleaned = re.sub(r"[^\w\s]", ' ', t)
+        cleaned = _PUNCT_RE.sub(' ', t)
         for w in cleaned.lower().split():
             # filter out very short common words
             if len(w) > 2:
                 words.append(w)
-                
-    counts = {}
-    for w in words:
-        counts[w] = counts.get(w, 0) + 1
-        
+
+    counts = Counter(words)
     repeated = {w: c for w, c in counts.items() if c > 2}
     return repeated
 
 
+def _analyze_translated_headers_pandas(translated_titles):
+    # Imported lazily so small runs don't pay the pandas import cost
+    import pandas as pd
+
+    # Runs of 3+ word characters are exactly the words longer than 2 chars left after stripping punctuation
+    s = pd.Series(translated_titles, dtype='object').dropna().str.lower()
+    words = s.str.findall(r'\w{3,}').explode().dropna()
+    # Report words in first-seen order, like the Counter path
+    counts = words.value_counts(sort=False).reindex(words.drop_duplicates())
+    return {w: int(c) for w, c in counts[counts > 2].items()}
+
+
 # ---------- BrowserStack Remote Driver ----------
 
 # ---------- BrowserStack Remote Driver ----------
@@ -304,37 +569,53 @@ def get_browserstack_driver(cap: dict):
 # ---------- Orchestration ----------
 
 def run_full_flow_local():
-    driver = None
+    drivers = []
     try:
-        driver = get_local_driver('chrome')
-        results = scrape_opinion_articles(driver, max_articles=5)
+        # Start the rest of the pool while the first browser loads the landing page,
+        # so browser startup isn't paid per article or after URL collection
+        with ThreadPoolExecutor(max_workers=LOCAL_POOL_SIZE) as ex:
+            futures = [ex.submit(get_local_driver, 'chrome') for _ in range(LOCAL_POOL_SIZE - 1)]
+            try:
+                drivers.append(get_local_driver('chrome'))
+                article_urls = collect_opinion_urls(drivers[0], max_articles=5)
+            finally:
+                # Always collect the extra browsers so they get quit even if the landing page failed
+                for fut in futures:
+                    try:
+                        drivers.append(fut.result())
+                    except Exception as e:
+                        print('Could not start an extra local browser:', e)
+
+        # Quit the browsers there is no work for
+        pool_size = max(1, min(LOCAL_POOL_SIZE, len(article_urls)))
+        for driver in drivers[pool_size:]:
+            try:
+                driver.quit()
+            except Exception:
+                pass # Ignore quit errors
+        del drivers[pool_size:]
+
+        driver_pool = queue.Queue()
+        for driver in drivers:
+            driver_pool.put(driver)
+        results = scrape_urls_with_driver_pool(article_urls, driver_pool, max_workers=len(drivers))
     except Exception as e:
         print(f"Local run failed during scraping: {e}")
         return
     finally:
-        if driver:
-            driver.quit()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass # Ignore quit errors
 
     if not results:
         print("No results found, exiting.")
         return
 
-    # Translate titles using Google Cloud Translate (example)
-    titles = [r['title_es'] for r in results]
-    translated = []
-    if HAS_GOOGLE:
-        try:
-            print("Translating titles...")
-            translated = translate_texts_google(titles, target='en')
-        except Exception as e:
-            print('Google Translate failed:', e)
-            translated = ['(translation failed)'] * len(titles)
-    else:
+    # Titles were translated with Google Cloud Translate while scraping
+    if not HAS_GOOGLE:
         print("Google Translate library not found. Skipping translation.")
-        translated = ['(google lib missing)'] * len(titles)
-
-    for i, r in enumerate(results):
-        r['title_en'] = translated[i]
 
     # Print outputs
     for r in results:
@@ -356,10 +637,14 @@ def run_full_flow_local():
 
 # ---------- Example BrowserStack parallel run ----------
 
-def browserstack_worker(cap):
-    driver = get_browserstack_driver(cap)
+def browserstack_worker(cap, url_batches, driver=None):
+    # Reuse driver if the session is already open, otherwise start one for cap.
+    # All batches run on this one session so session startup is paid only once.
+    driver = driver or get_browserstack_driver(cap)
     try:
-        res = scrape_opinion_articles(driver, max_articles=5)
+        res = []
+        for urls in url_batches:
+            res.extend(scrape_urls(driver, urls))
         return res
     finally:
         try:
@@ -368,11 +653,62 @@ def browserstack_worker(cap):
             pass # Ignore quit errors
 
 
-def run_on_browserstack_parallel(capabilities_list):
+def _drain_batches(batch_queue):
+    """Yield URL batches from batch_queue until it is empty."""
+    while True:
+        try:
+            yield batch_queue.get_nowait()
+        except queue.Empty:
+            return
+
+
+def run_on_browserstack_parallel(capabilities_list, max_articles=5):
     # capabilities_list: list of desiredCapabilities dicts for BrowserStack sessions
+    # Every session starts at once. The first one up discovers the article URLs (falling
+    # back to the next session if that fails) while the others are still starting.
+    # The URLs are split into batches on a shared queue, and each session starts pulling
+    # batches as soon as it is up, so no article is scraped more than once and no
+    # session sits idle waiting for the slowest one to start.
+    # max_articles is per session, so together they cover len(capabilities_list) * max_articles.
+    n = len(capabilities_list)
+    batch_queue = queue.Queue()
     results_all = []
-    with ThreadPoolExecutor(max_workers=len(capabilities_list)) as ex:
-        futures = [ex.submit(browserstack_worker, cap) for cap in capabilities_list]
+    with ThreadPoolExecutor(max_workers=n) as ex:
+        session_futures = {ex.submit(get_browserstack_driver, cap): cap for cap in capabilities_list}
+
+        futures = []
+        waiting = [] # sessions that came up before the URLs were known
+        article_urls = None
+        for fut in as_completed(session_futures):
+            try:
+                driver = fut.result()
+            except Exception as e:
+                print('A worker failed:', e)
+                continue
+            waiting.append((session_futures[fut], driver))
+
+            if article_urls is None:
+                try:
+                    article_urls = collect_opinion_urls(driver, n * max_articles)
+                except Exception as e:
+                    print('Collecting article URLs failed, trying the next session:', e)
+                    continue
+                # Plan all the work up front as batches on the shared queue
+                for j in range(0, len(article_urls), BROWSERSTACK_BATCH_SIZE):
+                    batch_queue.put(article_urls[j:j + BROWSERSTACK_BATCH_SIZE])
+
+            for cap, driver in waiting:
+                futures.append(ex.submit(browserstack_worker, cap, _drain_batches(batch_queue), driver))
+            waiting = []
+
+        if article_urls is None:
+            print('No article URLs collected on any BrowserStack session.')
+        for cap, driver in waiting:
+            try:
+                driver.quit()
+            except Exception:
+                pass # Ignore quit errors
+
         for fut in as_completed(futures):
             try:
                 results_all.extend(fut.result())
@@ -449,7 +785,7 @@ if __name__ == '__main__':
             }
         ]
         
-        print("Running 5 parallel sessions on BrowserStack...")
+        print(f"Running {len(caps)} parallel sessions on BrowserStack, sharing the articles between them...")
         results = run_on_browserstack_parallel(caps)
         
         # --- ADDED: Translation and Analysis for BS results ---
@@ -457,31 +793,14 @@ if __name__ == '__main__':
             print("No results collected, skipping translation and analysis.")
             exit()
 
-        # Dedupe results (parallel runs might get same articles)
-        seen_urls = set()
-        unique_results = []
-        for r in results:
-            if r['url'] not in seen_urls:
-                seen_urls.add(r['url'])
-                unique_results.append(r)
-        
+        # Each worker scraped a disjoint shard of the URLs, so results are already unique
+        unique_results = results
+
         print(f"Found {len(unique_results)} unique articles.")
 
-        titles = [r['title_es'] for r in unique_results]
-        translated = []
-        if HAS_GOOGLE:
-            try:
-                print("Translating titles...")
-                translated = translate_texts_google(titles, target='en')
-            except Exception as e:
-                print('Google Translate failed:', e)
-                translated = ['(translation failed)'] * len(titles)
-        else:
+        # Titles were translated with Google Cloud Translate while scraping
+        if not HAS_GOOGLE:
             print("Google Translate library not found. Skipping translation.")
-            translated = ['(google lib missing)'] * len(titles)
-
-        for i, r in enumerate(unique_results):
-            r['title_en'] = translated[i]
 
         # Print outputs
         for r in unique_results:
@@ -0,0 +1,136 @@
+from types import SimpleNamespace
+
+import pytest
+
+import sele
+
+
+class FakeTranslateClient:
+    """Stands in for translate.TranslationServiceClient; upper-cases every text."""
+
+    def __init__(self):
+        self.requests = []
+
+    def translate_text(self, request):
+        self.requests.append(list(request['contents']))
+        return SimpleNamespace(translations=[SimpleNamespace(translated_text=t.upper())
+                                             for t in request['contents']])
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    client = FakeTranslateClient()
+    monkeypatch.setattr(sele, 'HAS_GOOGLE', True)
+    monkeypatch.setattr(sele, '_get_translate_client', lambda: (client, 'projects/test/locations/global'))
+    monkeypatch.setattr(sele, '_translation_cache', sele.OrderedDict())
+    return client
+
+
+def test_translate_keeps_order_with_mixed_cached_and_uncached(fake_client):
+    assert sele.translate_texts_google(['b', 'd']) == ['B', 'D']
+
+    assert sele.translate_texts_google(['a', 'b', 'c', 'd']) == ['A', 'B', 'C', 'D']
+    assert fake_client.requests == [['b', 'd'], ['a', 'c']]
+
+
+def test_translate_sends_duplicates_once(fake_client):
+    assert sele.translate_texts_google(['a', 'b', 'a']) == ['A', 'B', 'A']
+    assert fake_client.requests == [['a', 'b']]
+
+
+def test_translate_cache_evicts_least_recently_used(fake_client, monkeypatch):
+    monkeypatch.setattr(sele, 'TRANSLATION_CACHE_SIZE', 2)
+    sele.translate_texts_google(['a', 'b'])
+    sele.translate_texts_google(['a']) # refresh 'a', so 'b' is now the oldest
+    sele.translate_texts_google(['c'])
+
+    assert len(sele._translation_cache) == 2
+    fake_client.requests.clear()
+    sele.translate_texts_google(['a', 'b', 'c'])
+    assert fake_client.requests == [['b']]
+
+
+def test_translate_raises_on_short_response(fake_client, monkeypatch):
+    monkeypatch.setattr(fake_client, 'translate_text',
+                        lambda request: SimpleNamespace(translations=[]))
+    with pytest.raises(RuntimeError):
+        sele.translate_texts_google(['a'])
+
+
+def test_chunk_texts_splits_at_item_limit():
+    assert list(sele._chunk_texts(['a'] * 5, max_items=2, max_chars=100)) == [['a', 'a'], ['a', 'a'], ['a']]
+
+
+def test_chunk_texts_splits_at_char_limit():
+    texts = ['aaaa', 'bbbb', 'cc', 'dddddddddd']
+    assert list(sele._chunk_texts(texts, max_items=100, max_chars=8)) == [['aaaa', 'bbbb'], ['cc'], ['dddddddddd']]
+
+
+def test_analyze_pandas_path_matches_counter_path(monkeypatch):
+    pytest.importorskip('pandas')
+    titles = ["Spain's war, and the war!", 'Élite élite ÉLITE: the war?', None, '',
+              "Don't panic; the ñandú runs", 'x_y and the ñandú... the ñandú (again)'] * 3
+
+    monkeypatch.setattr(sele, 'PANDAS_MIN_TITLES', 10 ** 9)
+    expected = sele.analyze_translated_headers(titles)
+    monkeypatch.setattr(sele, 'PANDAS_MIN_TITLES', 0)
+    actual = sele.analyze_translated_headers(titles)
+
+    assert list(actual.items()) == list(expected.items())
+    assert 'ñandú' in actual and 'élite' in actual
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('https://elpais.com/opinion/2024-05-01/x.html', True),
+    ('https://elpais.com/mexico/opinion/2024-05-01/x.html', True),
+    ('https://www.elpais.com/opinion/x.html', True),
+    ('https://elpais.com/opinion/x.html\n', False),
+    ('https://elpais.com/opinion/', False),
+    ('https://elpais.com/deportes/x.html', False),
+])
+def test_opinion_url_filter(url, expected):
+    assert bool(sele._OPINION_URL_RE.fullmatch(url)) is expected
+
+
+class FakeImageResponse:
+    def __init__(self, content_type, body=b'img'):
+        self.status_code = 200
+        self.headers = {'content-type': content_type}
+        self.body = body
+
+    def iter_content(self, chunk_size):
+        yield self.body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def fake_images(tmp_path, monkeypatch):
+    monkeypatch.setattr(sele, 'IMAGES_DIR', tmp_path)
+    requested = []
+
+    def use(content_type):
+        session = SimpleNamespace(get=lambda url, **kw: requested.append(url) or FakeImageResponse(content_type))
+        monkeypatch.setattr(sele, 'get_http_session', lambda: session)
+        return requested
+    return use
+
+
+def test_cover_image_extension_follows_content_type(fake_images, tmp_path):
+    requested = fake_images('image/png')
+    path = sele._fetch_cover_image('https://elpais.com/opinion/a.html', 'https://img.example/x.jpg')
+
+    assert path.endswith('.png') and (tmp_path / path).exists()
+    # The renamed file still counts as cached on the next run
+    assert sele._fetch_cover_image('https://elpais.com/opinion/a.html', 'https://img.example/x.jpg') == path
+    assert len(requested) == 1
+
+
+def test_cover_image_keeps_url_extension_without_content_type(fake_images):
+    fake_images('')
+    path = sele._fetch_cover_image('https://elpais.com/opinion/a.html', 'https://img.example/x.webp')
+    assert path.endswith('.webp')